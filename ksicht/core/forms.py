@@ -2,6 +2,7 @@ from functools import partial
 
 from crispy_forms.helper import FormHelper
 from django import forms
+from django.db import transaction
 from django.template.defaultfilters import filesizeformat
 from django.urls import reverse
 from django_select2.forms import Select2MultipleWidget
@@ -99,11 +100,9 @@ class SubmissionOverviewFormSet(forms.BaseFormSet):
 
 
 class ScoringForm(forms.ModelForm):
-    def __init__(self, *args, max_score, sticker_choices, **kwargs):
+    def __init__(self, *args, max_score, **kwargs):
         super().__init__(*args, **kwargs)
 
-        self.sticker_choices = sticker_choices
-
         self.fields["score"] = forms.DecimalField(
             label="",
             max_value=max_score,
@@ -119,8 +118,31 @@ class ScoringForm(forms.ModelForm):
             required=False,
         )
 
+
+class ScoringFormSet(forms.BaseModelFormSet):
     def save(self, commit=True):
-        self.instance.stickers.set(
-            self.sticker_choices.filter(pk__in=self.cleaned_data.get("stickers", []))
-        )
-        return super().save(commit)
+        """Save scores and replace stickers of all changed submissions in bulk."""
+        if not commit:
+            return super().save(commit=False)
+
+        with transaction.atomic():
+            instances = super().save(commit=False)
+
+            for instance in instances:
+                instance.save()
+
+            changed_forms = [f for f in self.initial_forms if f.has_changed()]
+            through = models.TaskSolutionSubmission.stickers.through
+            through.objects.filter(
+                tasksolutionsubmission__in=[f.instance for f in changed_forms]
+            ).delete()
+            through.objects.bulk_create(
+                [
+                    through(tasksolutionsubmission_id=f.instance.pk, sticker_id=s.pk)
+                    for f in changed_forms
+                    for s in f.cleaned_data.get("stickers", [])
+                ],
+                batch_size=1000,
+            )
+
+        return instances
@@ -0,0 +1,17 @@
+# Generated by Django 2.2.15 on 2026-10-15 05:40
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0010_auto_20220331_1720'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='tasksolutionsubmission',
+            index=models.Index(fields=['application', 'task'], name='core_sub_app_task_idx'),
+        ),
+    ]
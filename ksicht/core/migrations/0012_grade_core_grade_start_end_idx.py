@@ -0,0 +1,17 @@
+# Generated by Django 2.2.15 on 2026-10-15 05:50
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0011_auto_20261015_0540'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='grade',
+            index=models.Index(fields=['start_date', 'end_date'], name='core_grade_start_end_idx'),
+        ),
+    ]
@@ -0,0 +1,27 @@
+# Generated by Django 2.2.15 on 2026-10-15 06:00
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0012_grade_core_grade_start_end_idx'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='tasksolutionsubmission',
+            name='core_sub_app_task_idx',
+        ),
+        migrations.AddIndex(
+            model_name='tasksolutionsubmission',
+            index=models.Index(fields=['application', 'task', 'score'], name='core_sub_app_task_score_idx'),
+        ),
+        migrations.AlterField(
+            model_name='tasksolutionsubmission',
+            name='application',
+            field=models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, related_name='solution_submissions', to='core.GradeApplication', verbose_name='Přihláška'),
+        ),
+    ]
@@ -1,4 +1,4 @@
-from datetime import date, datetime
+from datetime import date
 from decimal import Decimal
 import logging
 from operator import attrgetter
@@ -12,6 +12,8 @@ from django.core.validators import MinValueValidator
 from django.core.files.base import File
 from django.db import models
 from django.urls import reverse
+from django.utils import timezone
+from django.utils.functional import cached_property
 from django.utils.text import slugify
 import pydash as py_
 
@@ -27,32 +29,42 @@ class User(AbstractCUser):
         return f"{self.get_full_name()} <{self.get_username()}>"
 
     def is_participant(self):
-        return Participant.objects.filter(user=self).exists()
+        # Loads (and caches) the profile once, so later access to it is free
+        return hasattr(self, "participant_profile")
 
 
 class GradeManager(models.Manager):
-    def get_current(self, current=None):
+    def _current(self, current=None):
         current_date = current or date.today()
-        return self.filter(
-            start_date__lte=current_date, end_date__gte=current_date
-        ).first()
+        return self.filter(start_date__lte=current_date, end_date__gte=current_date)
+
+    def get_current(self, current=None):
+        return self._current(current).first()
+
+    def get_current_pk(self, current=None):
+        """Return just the primary key of current grade, useful for existence checks."""
+        return self._current(current).values_list("pk", flat=True).first()
 
     def archive(self, current=None):
         current_date = current or date.today()
         return self.filter(end_date__lt=current_date)
 
 
+def _current_year():
+    return date.today().year
+
+
 def default_grade_school_year():
-    current_year = date.today()
-    return f"{current_year.year}/{current_year.year + 1}"
+    year = _current_year()
+    return f"{year}/{year + 1}"
 
 
 def default_grade_start():
-    return date(date.today().year, 8, 1)
+    return date(_current_year(), 8, 1)
 
 
 def default_grade_end():
-    return date(date.today().year + 1, 7, 31)
+    return date(_current_year() + 1, 7, 31)
 
 
 class Grade(models.Model):
@@ -87,6 +99,11 @@ class Grade(models.Model):
         verbose_name = "Ročník"
         verbose_name_plural = "Ročníky"
         ordering = ("-end_date",)
+        indexes = (
+            models.Index(
+                fields=("start_date", "end_date"), name="core_grade_start_end_idx"
+            ),
+        )
 
     @property
     def is_in_progress(self):
@@ -104,16 +121,10 @@ class Grade(models.Model):
         if self.start_date is not None and self.end_date is not None:
             g = (
                 Grade.objects.filter(
-                    models.Q(
-                        start_date__lte=self.start_date,
-                        end_date__gte=self.start_date,
-                    )
-                    | models.Q(
-                        start_date__lte=self.end_date,
-                        end_date__gte=self.end_date,
-                    )
+                    start_date__lte=self.end_date, end_date__gte=self.start_date
                 )
                 .exclude(pk=self.pk)
+                .only("pk", "school_year")
                 .first()
             )
 
@@ -130,22 +141,36 @@ class Grade(models.Model):
         return self._prefetched_series
 
     def get_current_series(self):
-        """Return first series that can still accept solution submissions from participants."""
+        """Return first series that can still accept solution submissions from participants.
+
+        Uses the prefetched series when they have been requested, otherwise a single query."""
+        now = timezone.now()
+
+        if hasattr(self, "_prefetched_series"):
+            return min(
+                (
+                    s
+                    for s in self._prefetched_series
+                    if s.accepts_solution_submissions(now)
+                ),
+                key=attrgetter("submission_deadline"),
+                default=None,
+            )
+
         return (
-            py_.chain(list(self.prefetch_series()))
-            .filter(attrgetter("accepts_solution_submissions"))
-            .sort(key=attrgetter("submission_deadline"))
-            .head()
-            .value()
+            self.series.filter(submission_deadline__gt=now)
+            .order_by("submission_deadline")
+            .first()
         )
 
     def get_previous_series(self):
         """Return last series that has been closed.
 
         This is useful for staff to get what needs to be worked with easily."""
+        now = timezone.now()
         return (
             py_.chain(list(self.prefetch_series()))
-            .filter(lambda s: not s.accepts_solution_submissions)
+            .filter(lambda s: not s.accepts_solution_submissions(now))
             .sort(key=attrgetter("submission_deadline"))
             .reverse()
             .head()
@@ -154,6 +179,7 @@ class Grade(models.Model):
 
     def get_future_series(self):
         """Get all future series, e.g. those that will come after the current one."""
+        self.prefetch_series()
         current_series = self.get_current_series()
 
         if not current_series:
@@ -217,11 +243,8 @@ class GradeSeries(models.Model):
             "core:series_detail", kwargs={"pk": self.pk, "grade_id": self.grade_id}
         )
 
-    @property
-    def accepts_solution_submissions(self):
-        return self.task_file is not None and self.submission_deadline > datetime.now(
-            self.submission_deadline.tzinfo
-        )
+    def accepts_solution_submissions(self, now=None):
+        return self.submission_deadline > (now or timezone.now())
 
     def get_rankings(self, exclude_submissionless=True):
         """Calculate results for series.
@@ -237,49 +260,50 @@ class GradeSeries(models.Model):
         if exclude_submissionless:
             applications = applications.exclude(solution_submissions=None)
 
-        tasks = self.tasks.all()
-        submissions = TaskSolutionSubmission.objects.filter(
-            application__grade=self.grade, task__series__series__lte=self.series
+        applications = list(applications)
+        # All tasks counting towards the results so far, tasks of this series among them.
+        # Ordered the same way as series tasks are listed, so score columns line up.
+        all_tasks = list(
+            Task.objects.filter(
+                series__grade=self.grade, series__series__lte=self.series
+            )
+            .order_by("series__series", "nr")
+            .only("id", "nr", "title", "points", "series")
+        )
+        tasks = [t for t in all_tasks if t.series_id == self.pk]
+        submissions = (
+            TaskSolutionSubmission.objects.filter(
+                application__grade=self.grade, task__series__series__lte=self.series
+            )
+            .values_list("application_id", "task_id", "score")
+            .iterator(chunk_size=2000)
         )
 
-        scoring_dict = {
-            a: {"by_tasks": {t: None for t in tasks}, "total": Decimal("0")}
-            for a in applications
-        }
-
-        def _find_application(app_id):
-            return py_.find(applications, lambda a: a.pk == app_id)
-
-        def _find_task(task_id):
-            return py_.find(tasks, lambda t: t.pk == task_id)
-
-        for s in submissions:
-            a = _find_application(s.application_id)
-            t = _find_task(s.task_id)
+        # Scores are kept column-wise: a row of task scores and a total per application
+        app_idx = {a.pk: i for i, a in enumerate(applications)}
+        task_idx = {t.pk: j for j, t in enumerate(tasks)}
+        scores = [[None] * len(tasks) for _ in applications]
+        totals = [Decimal("0")] * len(applications)
 
-            if t:
-                scoring_dict[a]["by_tasks"][t] = s.score
+        for application_id, task_id, score in submissions:
+            i = app_idx[application_id]
+            j = task_idx.get(task_id)
 
-            scoring_dict[a]["total"] += s.score or Decimal("0")
+            if j is not None:
+                scores[i][j] = score
 
-        scoring = [
-            (application, scores["by_tasks"], scores["total"])
-            for (application, scores) in scoring_dict.items()
-        ]
+            totals[i] += score or Decimal("0")
 
-        # Attach ranks
+        # Rank by sorting positions on totals (stable, so ties keep application order)
+        order = sorted(range(len(applications)), key=totals.__getitem__, reverse=True)
         sorted_scoring = [
             # (application, rank, task scores, total score)
-            (row[0], index + 1, row[1], row[2])
-            for (index, row) in enumerate(
-                sorted(scoring, key=lambda r: r[2], reverse=True)
-            )
+            (applications[i], rank, scores[i], totals[i])
+            for (rank, i) in enumerate(order, start=1)
         ]
 
         return {
-            "max_score": Task.objects.filter(
-                series__grade=self.grade, series__series__lte=self.series
-            ).aggregate(models.Sum("points"))["points__sum"],
+            "max_score": sum(t.points for t in all_tasks),
             "listing": sorted_scoring,
         }
 
@@ -515,6 +539,8 @@ class TaskSolutionSubmission(models.Model):
         blank=False,
         on_delete=models.CASCADE,
         related_name="solution_submissions",
+        # Covered by the (application, task, score) index
+        db_index=False,
     )
     task = models.ForeignKey(
         Task,
@@ -558,6 +584,12 @@ class TaskSolutionSubmission(models.Model):
             ("change_solution_submission_presence", "Úprava stavu odevzdání řešení"),
             ("scoring", "Bodování"),
         )
+        indexes = (
+            models.Index(
+                fields=("application", "task", "score"),
+                name="core_sub_app_task_score_idx",
+            ),
+        )
 
     def __str__(self):
         return f"Řešení <{self.task}> pro přihlášku <{self.application_id}>"
@@ -740,8 +772,12 @@ class Event(models.Model):
     def __str__(self):
         return str(self.title)
 
+    @cached_property
+    def slug(self):
+        return slugify(self.title)
+
     def _build_url(self, name):
-        return reverse(name, kwargs={"pk": self.pk, "slug": slugify(self.title)})
+        return reverse(name, kwargs={"pk": self.pk, "slug": self.slug})
 
     def get_absolute_url(self):
         return self._build_url("core:event_detail")
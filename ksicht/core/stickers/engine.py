@@ -19,9 +19,11 @@ def get_eligibility(current_series):
     applications = grade.applications.select_related("participant__user")
     series = models.GradeSeries.objects.filter(grade=grade)
     tasks = models.Task.objects.filter(series__grade=grade)
-    submitted_solutions = models.TaskSolutionSubmission.objects.filter(
-        task__series__grade=grade
-    ).select_related("task")
+    submitted_solutions = (
+        models.TaskSolutionSubmission.objects.filter(task__series__grade=grade)
+        .select_related("task")
+        .defer("file_for_export_normal", "file_for_export_duplex")
+    )
 
     eligibility = []
     all_application_pks = [a.pk for a in applications]
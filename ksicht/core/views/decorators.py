@@ -5,7 +5,7 @@ from django.contrib.auth.decorators import user_passes_test
 from django.shortcuts import redirect
 from django.urls import reverse_lazy
 
-from ..models import Grade, Participant
+from ..models import Grade
 
 
 def is_participant(
@@ -13,7 +13,7 @@ def is_participant(
 ):
     """Decorator for views that checks that the user is a particpant, e.g. has a participant profile."""
     actual_decorator = user_passes_test(
-        lambda u: Participant.objects.filter(user=u).exists(),
+        lambda u: hasattr(u, "participant_profile"),
         login_url=reverse_lazy("core:current_grade"),
         redirect_field_name=redirect_field_name,
     )
@@ -27,7 +27,7 @@ def current_grade_exists(function):
 
     @wraps(function)
     def wrap(request, *args, **kwargs):
-        grade_exists = Grade.objects.get_current() is not None
+        grade_exists = Grade.objects.get_current_pk() is not None
 
         if grade_exists:
             return function(request, *args, **kwargs)
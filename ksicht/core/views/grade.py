@@ -9,7 +9,6 @@ from django.shortcuts import redirect
 from django.utils.decorators import method_decorator
 from django.views.generic.detail import BaseDetailView, DetailView
 from django.views.generic.edit import BaseFormView
-import pydash as py_
 
 from .. import forms, models
 from .decorators import current_grade_exists, is_participant
@@ -27,7 +26,13 @@ class CurrentGradeView(DetailView):
     template_name = "core/current_grade.html"
 
     def get_object(self, queryset=None):
-        return models.Grade.objects.get_current()
+        grade = models.Grade.objects.get_current()
+
+        if grade is not None:
+            # The page lists all series, let current series lookups reuse them
+            grade.prefetch_series()
+
+        return grade
 
     def get_context_data(self, **kwargs):
         data = super().get_context_data(**kwargs)
@@ -85,13 +90,17 @@ class GradeResultsExportView(BaseDetailView):
     def render_to_response(self, context):
         grade = context["object"]
 
-        all_tasks = models.Task.objects.filter(series__grade=grade)
+        all_tasks = list(
+            models.Task.objects.filter(series__grade=grade).select_related("series")
+        )
         all_submissions = models.TaskSolutionSubmission.objects.filter(
-            task__in=all_tasks
+            task__series__grade=grade
+        ).defer("file", "file_for_export_normal", "file_for_export_duplex")
+        all_applications = list(
+            models.GradeApplication.objects.filter(grade=grade).select_related(
+                "participant__user"
+            )
         )
-        all_applications = models.GradeApplication.objects.filter(
-            grade=grade
-        ).prefetch_related("participant__user")
 
         response = HttpResponse(content_type="text/csv")
         file_expr = "filename*=utf-8''{}".format(quote(f"{grade} - výsledky.csv"))
@@ -115,11 +124,8 @@ class GradeResultsExportView(BaseDetailView):
         # This closely mirrors GradeSeries.get_rankings.
         # But it includes all tasks in all series.
 
-        def _find_application(app_id):
-            return py_.find(all_applications, lambda a: a.pk == app_id)
-
-        def _find_task(task_id):
-            return py_.find(all_tasks, lambda t: t.pk == task_id)
+        app_index = {a.pk: a for a in all_applications}
+        task_index = {t.pk: t for t in all_tasks}
 
         scoring_dict = {
             a: {"by_tasks": {t: None for t in all_tasks}, "total": Decimal("0")}
@@ -127,11 +133,10 @@ class GradeResultsExportView(BaseDetailView):
         }
 
         for s in all_submissions:
-            a = _find_application(s.application_id)
-            t = _find_task(s.task_id)
+            a = app_index[s.application_id]
+            t = task_index[s.task_id]
 
-            if t:
-                scoring_dict[a]["by_tasks"][t] = s.score
+            scoring_dict[a]["by_tasks"][t] = s.score
 
             scoring_dict[a]["total"] += s.score or Decimal("0")
 
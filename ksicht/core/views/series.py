@@ -1,7 +1,6 @@
 from operator import attrgetter
 
 from django.views.generic.detail import DetailView
-import pydash as py_
 
 from .. import models, stickers
 
@@ -14,7 +13,7 @@ __all__ = (
 
 
 class SeriesDetailView(DetailView):
-    queryset = models.GradeSeries.objects.all()
+    queryset = models.GradeSeries.objects.select_related("grade")
     template_name = "core/manage/series_detail.html"
 
 
@@ -29,22 +28,16 @@ class SeriesResultsView(DetailView):
 
 def sticker_nrs_to_objects(listing):
     """Replace sticker numbers in eligibility listing with real sticker objects."""
-    sticker_nrs = (
-        py_.py_(list(nrs) for application, nrs in listing).flatten().uniq().value()
-    )
-    stickers_by_nr = {
-        s.nr: s for s in models.Sticker.objects.filter(nr__in=sticker_nrs)
+    sticker_nrs = {nr for _, nrs in listing for nr in nrs}
+    stickers_by_nr = models.Sticker.objects.only(
+        "id", "nr", "title", "handpicked"
+    ).in_bulk(list(sticker_nrs), field_name="nr")
+
+    return {
+        application: [stickers_by_nr[nr] for nr in nrs if nr in stickers_by_nr]
+        for application, nrs in listing
     }
 
-    def _replace_with_sticker_objs(listing_item):
-        application, sticker_nrs = listing_item
-        return (
-            application,
-            [stickers_by_nr[nr] for nr in sticker_nrs if nr in stickers_by_nr],
-        )
-
-    return dict([_replace_with_sticker_objs(l) for l in listing])
-
 
 def get_event_stickers(series):
     """Resolve stickers to be collected from events.
@@ -86,9 +79,11 @@ class StickerAssignmentOverview(DetailView):
             )
         )
 
-        series_submissions = models.TaskSolutionSubmission.objects.filter(
-            task__series=series
-        ).prefetch_related("stickers")
+        series_submissions = (
+            models.TaskSolutionSubmission.objects.filter(task__series=series)
+            .defer("file", "file_for_export_normal", "file_for_export_duplex")
+            .prefetch_related("stickers")
+        )
         auto_stickers = sticker_nrs_to_objects(stickers.engine.get_eligibility(series))
         event_stickers = get_event_stickers(series)
 
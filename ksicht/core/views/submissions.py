@@ -24,7 +24,6 @@ from ..models import (
     GradeApplication,
     GradeSeries,
     Participant,
-    Sticker,
     Task,
     TaskSolutionSubmission,
 )
@@ -143,7 +142,7 @@ class SolutionSubmitDeleteView(DeleteView):
 
     def delete(self, request, *args, **kwargs):
         self.object = self.get_object()
-        accepts = self.object.task.series.accepts_solution_submissions
+        accepts = self.object.task.series.accepts_solution_submissions()
         if request.user == self.object.application.participant.user and accepts:
             return super(SolutionSubmitDeleteView, self).delete(request, *args, **kwargs)
         else:
@@ -152,7 +151,7 @@ class SolutionSubmitDeleteView(DeleteView):
     def render_to_response(self, context, **response_kwargs):
         response_kwargs.setdefault('content_type', self.content_type)
         self.object = self.get_object()
-        accepts = self.object.task.series.accepts_solution_submissions
+        accepts = self.object.task.series.accepts_solution_submissions()
         if self.request.user == self.object.application.participant.user and accepts:
             return super(SolutionSubmitDeleteView, self).render_to_response(context, **response_kwargs)
             
@@ -301,6 +300,7 @@ class ScoringView(FormView):
     form_class = modelformset_factory(
         TaskSolutionSubmission,
         form=forms.ScoringForm,
+        formset=forms.ScoringFormSet,
         fields=("id", "score", "stickers"),
         extra=0,
     )
@@ -326,12 +326,7 @@ class ScoringView(FormView):
                 "application__participant__user__last_name",
                 "application__participant__user__first_name",
             ),
-            "form_kwargs": {
-                "max_score": self.task.points,
-                "sticker_choices": Sticker.objects.filter(handpicked=True).order_by(
-                    "nr"
-                ),
-            },
+            "form_kwargs": {"max_score": self.task.points},
         }
 
     def form_valid(self, form):
@@ -0,0 +1,95 @@
+from datetime import date, datetime
+from decimal import Decimal
+
+from django.utils import timezone
+import pytest
+
+from ksicht.core import models
+from ksicht.core.views.submissions import ScoringView
+
+
+pytestmark = [pytest.mark.django_db]
+
+
+@pytest.fixture
+def task():
+    grade = models.Grade.objects.create(
+        school_year="2020", start_date=date(2020, 1, 1), end_date=date(2020, 12, 31)
+    )
+    series = models.GradeSeries.objects.create(
+        grade=grade,
+        series="1",
+        submission_deadline=timezone.make_aware(datetime(2020, 3, 1)),
+    )
+    return models.Task.objects.create(series=series, nr="1", points=10)
+
+
+def _submission(task, i, stickers=()):
+    participant = models.Participant.objects.create(
+        user=models.User.objects.create(email=f"u{i}@example.com")
+    )
+    application = models.GradeApplication.objects.create(
+        participant=participant, grade=task.series.grade
+    )
+    submission = models.TaskSolutionSubmission.objects.create(
+        application=application, task=task
+    )
+    submission.stickers.set(stickers)
+    return submission
+
+
+def _formset_data(rows):
+    data = {
+        "form-TOTAL_FORMS": str(len(rows)),
+        "form-INITIAL_FORMS": str(len(rows)),
+        "form-MIN_NUM_FORMS": "0",
+        "form-MAX_NUM_FORMS": "1000",
+    }
+
+    for i, (submission, score, stickers) in enumerate(rows):
+        data[f"form-{i}-id"] = str(submission.pk)
+        data[f"form-{i}-score"] = "" if score is None else str(score)
+        data[f"form-{i}-stickers"] = [str(s.pk) for s in stickers]
+
+    return data
+
+
+def test_scoring_formset_saves_scores_and_stickers(task):
+    st1, st2, st3 = (
+        models.Sticker.objects.create(nr=nr, title=f"Sticker {nr}") for nr in (1, 2, 3)
+    )
+
+    to_set = _submission(task, 1)
+    to_replace = _submission(task, 2, [st1])
+    to_clear = _submission(task, 3, [st1, st2])
+    score_only = _submission(task, 4, [st2])
+    unchanged = _submission(task, 5, [st1])
+
+    formset = ScoringView.form_class(
+        _formset_data(
+            (
+                (to_set, None, [st1, st2]),
+                (to_replace, None, [st3]),
+                (to_clear, None, []),
+                (score_only, Decimal("6"), [st2]),
+                (unchanged, None, [st1]),
+            )
+        ),
+        queryset=models.TaskSolutionSubmission.objects.filter(task=task),
+        form_kwargs={"max_score": task.points},
+    )
+
+    assert formset.is_valid(), formset.errors
+    formset.save()
+
+    def _sticker_nrs(submission):
+        return sorted(s.nr for s in submission.stickers.all())
+
+    assert _sticker_nrs(to_set) == [1, 2]
+    assert _sticker_nrs(to_replace) == [3]
+    assert _sticker_nrs(to_clear) == []
+    assert _sticker_nrs(score_only) == [2]
+    assert _sticker_nrs(unchanged) == [1]
+
+    score_only.refresh_from_db()
+    assert score_only.score == Decimal("6")
@@ -1,5 +1,8 @@
-from datetime import date, timedelta
+from datetime import date, datetime, timedelta
+from decimal import Decimal
 
+from django.core.exceptions import ValidationError
+from django.utils import timezone
 import pytest
 
 from ksicht.core import models
@@ -44,6 +47,31 @@ def test_get_current(sample_grades, current_date, grade):
         assert result is None
 
 
+def test_get_current_pk(sample_grades):
+    assert models.Grade.objects.get_current_pk(date(2010, 3, 1)) == sample_grades[1].pk
+    assert models.Grade.objects.get_current_pk(date(2012, 1, 1)) is None
+
+
+@pytest.mark.parametrize(
+    "start_date, end_date, overlaps",
+    (
+        (date(2008, 1, 1), date(2008, 12, 31), False),
+        (date(2008, 1, 1), date(2009, 5, 1), True),
+        (date(2009, 12, 1), date(2010, 2, 1), True),
+        (date(2008, 1, 1), date(2012, 1, 1), True),
+        (date(2011, 4, 11), date(2012, 1, 1), False),
+    ),
+)
+def test_full_clean_overlap(sample_grades, start_date, end_date, overlaps):
+    grade = models.Grade(school_year="New", start_date=start_date, end_date=end_date)
+
+    if overlaps:
+        with pytest.raises(ValidationError):
+            grade.full_clean()
+    else:
+        grade.full_clean()
+
+
 def test_active_in_series():
     u1 = models.User.objects.create(email="u1@example.com")
     u2 = models.User.objects.create(email="u2@example.com")
@@ -95,3 +123,115 @@ def test_active_in_series():
     active_in_series = models.Participant.objects.active_in_series(s3)
 
     assert sorted(list(active_in_series), key=lambda p: p.user_id) == [p1, p3]
+
+
+@pytest.fixture
+def ranked_series():
+    grade = models.Grade.objects.create(
+        school_year="2020", start_date=date(2020, 1, 1), end_date=date(2020, 12, 31)
+    )
+    s1 = models.GradeSeries.objects.create(
+        grade=grade,
+        series="1",
+        submission_deadline=timezone.make_aware(datetime(2020, 3, 1)),
+    )
+    s2 = models.GradeSeries.objects.create(
+        grade=grade,
+        series="2",
+        submission_deadline=timezone.make_aware(datetime(2020, 6, 1)),
+    )
+
+    t11 = models.Task.objects.create(series=s1, nr="1", points=10)
+    # Created out of order to make sure columns follow task numbers
+    t22 = models.Task.objects.create(series=s2, nr="2", points=5)
+    t21 = models.Task.objects.create(series=s2, nr="1", points=10)
+
+    applications = []
+
+    for i in range(4):
+        user = models.User.objects.create(email=f"u{i}@example.com")
+        participant = models.Participant.objects.create(user=user)
+        a = models.GradeApplication.objects.create(participant=participant, grade=grade)
+        a.created_at = timezone.make_aware(datetime(2020, 1, 1 + i))
+        a.save()
+        applications.append(a)
+
+    a1, a2, a3, _ = applications
+
+    for application, task, score in (
+        (a1, t11, Decimal("4")),
+        (a1, t21, Decimal("3")),
+        (a1, t22, None),
+        (a2, t11, Decimal("7")),
+        (a3, t21, Decimal("10")),
+        (a3, t22, Decimal("5")),
+    ):
+        models.TaskSolutionSubmission.objects.create(
+            application=application, task=task, score=score
+        )
+
+    return s1, s2, applications
+
+
+def test_get_rankings(ranked_series):
+    s1, s2, (a1, a2, a3, a4) = ranked_series
+
+    assert [t.nr for t in s2.tasks.all()] == ["1", "2"]
+
+    rankings = s2.get_rankings()
+
+    assert rankings["max_score"] == 25
+    # a1 and a2 are tied, the earlier application goes first
+    assert rankings["listing"] == [
+        (a3, 1, [10, 5], 15),
+        (a1, 2, [3, None], 7),
+        (a2, 3, [None, None], 7),
+    ]
+
+    rankings = s2.get_rankings(exclude_submissionless=False)
+
+    assert rankings["listing"][-1] == (a4, 4, [None, None], 0)
+
+
+def test_get_rankings_ignores_later_series(ranked_series):
+    s1, s2, (a1, a2, a3, a4) = ranked_series
+
+    rankings = s1.get_rankings()
+
+    assert rankings["max_score"] == 10
+    assert rankings["listing"] == [
+        (a2, 1, [7], 7),
+        (a1, 2, [4], 4),
+        (a3, 3, [None], 0),
+    ]
+
+
+def test_current_and_future_series_reuse_prefetched_series(
+    django_assert_num_queries,
+):
+    today = date.today()
+    grade = models.Grade.objects.create(
+        school_year="Current",
+        start_date=today - timedelta(days=30),
+        end_date=today + timedelta(days=30),
+    )
+    now = timezone.now()
+    models.GradeSeries.objects.create(
+        grade=grade, series="1", submission_deadline=now - timedelta(days=5)
+    )
+    s2 = models.GradeSeries.objects.create(
+        grade=grade, series="2", submission_deadline=now + timedelta(days=5)
+    )
+    s3 = models.GradeSeries.objects.create(
+        grade=grade, series="3", submission_deadline=now + timedelta(days=20)
+    )
+
+    assert grade.get_current_series() == s2
+
+    grade.prefetch_series()
+
+    # Series, their tasks and attachments
+    with django_assert_num_queries(3):
+        assert grade.get_current_series() == s2
+        assert grade.get_future_series() == [s3]
+        list(grade.prefetch_series())
@@ -1,11 +1,12 @@
-from datetime import datetime
+from datetime import date, datetime, timedelta
 from decimal import Decimal
 from uuid import uuid4
 
+from django.utils import timezone
 import pytest
 
 from ksicht.core import models
-from ksicht.core.stickers import resolvers
+from ksicht.core.stickers import engine, resolvers
 
 
 pytestmark = [pytest.mark.django_db]
@@ -720,3 +721,33 @@ def test_successful_solver(context, result):
 )
 def test_submitted_solution_in_last_series(context, result):
     assert resolvers.submitted_solution_in_last_series(context) is result
+
+
+def test_get_eligibility_includes_new_applications():
+    today = date.today()
+    grade = models.Grade.objects.create(
+        school_year="Current",
+        start_date=today - timedelta(days=30),
+        end_date=today + timedelta(days=30),
+    )
+    series = models.GradeSeries.objects.create(
+        grade=grade, series="1", submission_deadline=timezone.now() + timedelta(days=5)
+    )
+    models.Task.objects.create(series=series, nr="1", points=10)
+
+    p1 = models.Participant.objects.create(
+        user=models.User.objects.create(email="u1@example.com")
+    )
+    p1.applications.add(grade)
+
+    eligibility = engine.get_eligibility(series)
+    assert {a.participant_id for a, _ in eligibility} == {p1.pk}
+
+    # Applications are created through the M2M manager, bypassing post_save
+    p2 = models.Participant.objects.create(
+        user=models.User.objects.create(email="u2@example.com")
+    )
+    p2.applications.add(grade)
+
+    eligibility = engine.get_eligibility(series)
+    assert {a.participant_id for a, _ in eligibility} == {p1.pk, p2.pk}